@@ -16,260 +16,651 @@ Structure attendue du Word :
     • Tableaux : conservés et positionnés après le texte
 
 Usage:
-    python convert.py input.docx output.pptx
+    python convert.py [--no_cache] input.docx output.pptx [input2.docx output2.pptx ...]
+
+Plusieurs couples entrée/sortie sont convertis en parallèle. Le contenu extrait
+de chaque document Word est mis en cache dans le dossier .cache/ placé à côté
+du script (option --no_cache pour forcer une relecture complète).
 
 Le fichier template_CVA.pptx doit être présent dans le même dossier.
 """
 
 import sys
 import os
-from docx import Document
-from docx.shared import Pt
+import io
+import re
+import hashlib
+import pickle
+import posixpath
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from itertools import groupby, product
+from operator import itemgetter
+from xml.sax.saxutils import escape
+from lxml import etree
 from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.shapes import MSO_SHAPE_TYPE
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
-from pptx.dml.color import RGBColor
-
-# Conversion pixels vers pouces (96 pixels = 1 pouce)
-def px_to_inch(px):
-    return float(px) / 96.0
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
 
-# Conversion cm vers pouces et addition d'un déplacement vertical pour le titre (0.4 inch)
+# Zones de placement, en EMU (914 400 EMU par pouce, 96 pixels par pouce) :
+# valeurs précalculées, le titre étant descendu de 0.4 inch
 TITLE_ZONE = {
-    "x": Inches(px_to_inch(76)),
-    "y": Inches(px_to_inch(35) + 0.4),  # Ajout de 0.4 inch pour descendre le titre
-    "width": Inches(30.33 / 2.54),  # Conversion de 30.33 cm en pouces
-    "height": Inches(max(px_to_inch(70), 0.5))
+    "x": 723900,  # 76 px
+    "y": 699135,  # 35 px + 0.4 inch
+    "width": 10918800,  # 30.33 cm
+    "height": 666750  # 70 px (minimum 0.5 inch)
 }
 
 SUBTITLE_ZONE = {
-    "x": Inches(px_to_inch(76)),
-    "y": Inches(px_to_inch(119)),
-    "width": Inches(30.33 / 2.54),  # Conversion de 30.33 cm en pouces
-    "height": Inches(max(px_to_inch(56), 0.5))
+    "x": 723900,  # 76 px
+    "y": 1133475,  # 119 px
+    "width": 10918800,  # 30.33 cm
+    "height": 533400  # 56 px (minimum 0.5 inch)
 }
 
 CONTENT_ZONE = {
-    "x": Inches(px_to_inch(76)),
-    "y": Inches(px_to_inch(189)),
-    "width": Inches(30.33 / 2.54),  # Conversion de 30.33 cm en pouces
-    "height": Inches(max(px_to_inch(425), 1))
+    "x": 723900,  # 76 px
+    "y": 1800225,  # 189 px
+    "width": 10918800,  # 30.33 cm
+    "height": 4048124  # 425 px (minimum 1 inch)
 }
 
-def parse_word_document(doc_path):
-    """Parse le document Word et extrait les données de chaque slide."""
-    doc = Document(doc_path)
-    slides_data = []
-    current_slide = None
-    table_count = 0
+# Espacements et hauteur de ligne des tableaux, en EMU
+INCH_0_2 = 182880
+INCH_1 = 914400
+TABLE_ROW_HEIGHT = 274320  # 0.3 inch
+
+# Nombre maximal de niveaux de liste (0 à 8 dans Word comme dans PowerPoint)
+# et indentations précalculées par niveau
+MAX_LIST_LEVELS = 9
+_INDENTS = tuple("    " * i for i in range(MAX_LIST_LEVELS))
+
+# Forme <p:sp> d'une zone de texte telle que créée par add_textbox (retour à
+# la ligne, forme ajustée au texte), position et taille incluses : seuls
+# l'identifiant, le numéro du nom et le contenu du corps de texte (style de
+# liste et paragraphes) restent à insérer
+def _textbox_sp_xml(zone):
+    return (
+        '<p:sp><p:nvSpPr><p:cNvPr id="%%d" name="TextBox %%d"/><p:cNvSpPr txBox="1"/>'
+        '<p:nvPr/></p:nvSpPr><p:spPr><a:xfrm><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/>'
+        '</a:xfrm><a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+        '<p:txBody><a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr>%%s</p:txBody></p:sp>'
+        % (zone["x"], zone["y"], zone["width"], zone["height"])
+    )
+
+_TITLE_SP_XML = _textbox_sp_xml(TITLE_ZONE)
+_SUBTITLE_SP_XML = _textbox_sp_xml(SUBTITLE_ZONE)
+_CONTENT_SP_XML = _textbox_sp_xml(CONTENT_ZONE)
+
+# Style de liste de la zone de contenu : 3 points d'espacement après chaque
+# paragraphe, quel que soit son niveau
+_CONTENT_LST_STYLE = "<a:lstStyle>%s</a:lstStyle>" % "".join(
+    '<a:lvl%dpPr><a:spcAft><a:spcPts val="300"/></a:spcAft></a:lvl%dpPr>' % (lvl, lvl)
+    for lvl in range(1, MAX_LIST_LEVELS + 1)
+)
+
+# Enveloppe permettant d'analyser toutes les formes d'une slide en un seul appel
+_SHAPES_XML = "<p:spTree %s>%%s</p:spTree>" % nsdecls("p", "a")
+
+# Cellule de tableau telle que créée par add_table, avec ses paragraphes à
+# insérer, et enveloppe permettant d'analyser toutes les lignes d'un tableau
+# en un seul appel
+_CELL_XML = "<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>%s</a:txBody><a:tcPr/></a:tc>"
+_EMPTY_CELL_XML = _CELL_XML % "<a:p/>"
+_TABLE_XML = "<a:tbl %s>%%s</a:tbl>" % nsdecls("a")
+
+# Fréquence d'affichage de la progression (en nombre de slides)
+PROGRESS_INTERVAL = 50
+
+# Dossier du cache des documents Word déjà analysés, à côté du script et non
+# du répertoire courant pour ne jamais relire des fichiers .pkl étrangers
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+# Clés attendues de chaque slide d'une entrée du cache
+_SLIDE_KEYS = {"title", "subtitle", "content", "tables"}
+
+# Bas de la zone de contenu, utilisé pour le contrôle de débordement des tableaux
+CONTENT_BOTTOM = CONTENT_ZONE["y"] + CONTENT_ZONE["height"]
+
+# Espace de noms WordprocessingML et balises utilisées lors de la lecture
+W_NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+BODY_TAG = "{%s}body" % W_NS["w"]
+P_TAG = "{%s}p" % W_NS["w"]
+TBL_TAG = "{%s}tbl" % W_NS["w"]
+R_TAG = "{%s}r" % W_NS["w"]
+T_TAG = "{%s}t" % W_NS["w"]
+BR_TAG = "{%s}br" % W_NS["w"]
+RPR_TAG = "{%s}rPr" % W_NS["w"]
+B_TAG = "{%s}b" % W_NS["w"]
+I_TAG = "{%s}i" % W_NS["w"]
+U_TAG = "{%s}u" % W_NS["w"]
+TCPR_TAG = "{%s}tcPr" % W_NS["w"]
+GRIDSPAN_TAG = "{%s}gridSpan" % W_NS["w"]
+VMERGE_TAG = "{%s}vMerge" % W_NS["w"]
+W_VAL = "{%s}val" % W_NS["w"]
+W_TYPE = "{%s}type" % W_NS["w"]
+NUM_TAG = "{%s}num" % W_NS["w"]
+ABSTRACTNUM_TAG = "{%s}abstractNum" % W_NS["w"]
+LVL_TAG = "{%s}lvl" % W_NS["w"]
+LVLOVERRIDE_TAG = "{%s}lvlOverride" % W_NS["w"]
+W_NUMID = "{%s}numId" % W_NS["w"]
+W_ABSTRACTNUMID = "{%s}abstractNumId" % W_NS["w"]
+W_ILVL = "{%s}ilvl" % W_NS["w"]
+
+# Relations OPC menant à la partie principale du document et à sa numérotation
+REL_TAG = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+RT_OFFICE_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+RT_NUMBERING = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering"
+
+# Équivalents texte des éléments non textuels d'un run (comme python-docx)
+_RUN_CHARS = {
+    "{%s}tab" % W_NS["w"]: "\t",
+    "{%s}ptab" % W_NS["w"]: "\t",
+    "{%s}cr" % W_NS["w"]: "\n",
+    "{%s}noBreakHyphen" % W_NS["w"]: "-",
+}
+
+# Marqueurs de début de slide, de titre et de sous-titre (groupes 1, 2 et 3),
+# quel que soit l'espacement autour des séparateurs (espaces insécables
+# compris) ; les groupes 2 et 3 capturent directement le texte qui suit
+_MARKER_RE = re.compile(
+    r"(?i:(SLIDE))|Titre\s*:\s*(.*)|Sous-titre\s*/\s*Message\s+cl[ée]\s*:\s*(.*)",
+    re.S
+)
+_SLIDE, _TITLE = 1, 2
+
+# Sauts de ligne d'un texte, rendus par des <a:br/> dans PowerPoint
+_LINE_BREAK_RE = re.compile("\n|\v")
+
+# Runs d'un paragraphe : runs directs et runs des liens hypertexte
+_RUNS_XPATH = etree.XPath("./w:r | ./w:hyperlink/w:r", namespaces=W_NS)
+
+# Lignes d'un tableau et cellules d'une ligne, y compris celles placées dans
+# un contrôle de contenu <w:sdt> ou un élément <w:customXml>
+_ROWS_XPATH = etree.XPath(
+    "./w:tr | ./w:sdt/w:sdtContent/w:tr | ./w:customXml/w:tr", namespaces=W_NS
+)
+_CELLS_XPATH = etree.XPath(
+    "./w:tc | ./w:sdt/w:sdtContent/w:tc | ./w:customXml/w:tc", namespaces=W_NS
+)
+
+# Niveau et identifiant de numérotation d'un paragraphe, lus en un seul appel
+_NUMPR_XPATH = etree.XPath(
+    'concat(./w:pPr/w:numPr/w:ilvl/@w:val, "|", ./w:pPr/w:numPr/w:numId/@w:val)',
+    namespaces=W_NS
+)
+
+def _rel_target(docx_zip, source_part, rel_type):
+    """Nom dans l'archive de la partie ciblée par une relation de source_part.
+
+    Comme python-docx, les parties sont localisées par leurs relations et non
+    par un nom fixe ; source_part vide désigne le paquet lui-même
+    (_rels/.rels). Renvoie None si aucune relation de ce type n'existe.
+    """
+    directory, name = posixpath.split(source_part)
+    try:
+        rels = etree.fromstring(docx_zip.read(posixpath.join(directory, "_rels", name + ".rels")))
+    except KeyError:
+        return None
+    for rel in rels.iterchildren(REL_TAG):
+        if rel.get("Type") == rel_type and rel.get("TargetMode") != "External":
+            target = rel.get("Target")
+            if target.startswith("/"):
+                return target[1:]
+            return posixpath.normpath(posixpath.join(directory, target))
+    return None
+
+# Lecture de la partie de numérotation : format d'un niveau, niveau redéfini par un
+# <w:lvlOverride> et définition abstraite référencée par un <w:num>
+_NUMFMT_XPATH = etree.XPath("string(./w:numFmt/@w:val)", namespaces=W_NS)
+_OVERRIDE_NUMFMT_XPATH = etree.XPath("string(./w:lvl/w:numFmt/@w:val)", namespaces=W_NS)
+_ABSTRACTNUMID_XPATH = etree.XPath("string(./w:abstractNumId/@w:val)", namespaces=W_NS)
+
+def _numbering_list_types(docx_zip, document_part):
+    """Type de liste ("bullet" ou "number") de chaque couple (numId, ilvl).
     
-    # Collecte des paragraphes et tableaux en préservant l'ordre
-    elements = []
-    for para in doc.paragraphs:
-        elements.append(('paragraph', para))
-        text = para.text.strip()
-        
-        if not text:
-            continue
+    Les définitions de la partie de numérotation du document sont lues une
+    seule fois ; un document sans numérotation donne un dictionnaire vide.
+    """
+    numbering_part = _rel_target(docx_zip, document_part, RT_NUMBERING)
+    if numbering_part is None:
+        return {}
+    try:
+        root = etree.fromstring(docx_zip.read(numbering_part))
+    except KeyError:
+        return {}
+    
+    abstract_formats = {
+        abstract_num.get(W_ABSTRACTNUMID): {
+            lvl.get(W_ILVL): _NUMFMT_XPATH(lvl)
+            for lvl in abstract_num.iterchildren(LVL_TAG)
+        }
+        for abstract_num in root.iterchildren(ABSTRACTNUM_TAG)
+    }
+    
+    list_types = {}
+    for num in root.iterchildren(NUM_TAG):
+        formats = dict(abstract_formats.get(_ABSTRACTNUMID_XPATH(num), {}))
+        for override in num.iterchildren(LVLOVERRIDE_TAG):
+            num_fmt = _OVERRIDE_NUMFMT_XPATH(override)
+            if num_fmt:
+                formats[override.get(W_ILVL)] = num_fmt
+        num_id = num.get(W_NUMID)
+        for ilvl, num_fmt in formats.items():
+            if num_fmt:
+                list_types[num_id, ilvl] = "bullet" if num_fmt == "bullet" else "number"
+    return list_types
+
+# Formatages de run possibles (gras, italique, souligné), partagés par tous
+# les runs au lieu d'un triplet alloué pour chacun
+_RUN_FORMATS = {flags: flags for flags in product((False, True), repeat=3)}
+_PLAIN_RUN = _RUN_FORMATS[False, False, False]
+
+def _is_on(element):
+    """Indique si une propriété booléenne Word (<w:b/>, <w:i/>...) est active."""
+    return element is not None and element.get(W_VAL) not in ("0", "false", "off")
+
+def _run_flags(rPr):
+    """Gras, italique et souligné d'un run, lus sur son <w:rPr> (ou None).
+    
+    Le triplet renvoyé est l'une des instances partagées de _RUN_FORMATS.
+    """
+    if rPr is None:
+        return _PLAIN_RUN
+    u = rPr.find(U_TAG)
+    return _RUN_FORMATS[
+        _is_on(rPr.find(B_TAG)),
+        _is_on(rPr.find(I_TAG)),
+        u is not None and u.get(W_VAL, "none") != "none"
+    ]
+
+def _run_text(r):
+    """Texte d'un run <w:r>, tabulations et sauts de ligne compris."""
+    parts = []
+    for child in r:
+        tag = child.tag
+        if tag == T_TAG:
+            parts.append(child.text or "")
+        elif tag == BR_TAG:
+            if child.get(W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(_RUN_CHARS.get(tag, ""))
+    return "".join(parts)
+
+def _paragraph_text(p):
+    """Texte d'un paragraphe <w:p>, liens hypertexte, tabulations et sauts de ligne compris."""
+    return "".join(_run_text(r) for r in _RUNS_XPATH(p))
+
+def _table_rows(tbl):
+    """Extrait le texte d'un tableau <w:tbl> sous forme de liste de lignes.
+    
+    Comme python-docx, une cellule fusionnée horizontalement est répétée sur
+    chaque colonne couverte et une cellule fusionnée verticalement reprend le
+    texte de la cellule au-dessus. Les lignes sans cellule sont ignorées, si
+    bien qu'un tableau sans aucune cellule donne une liste vide.
+    """
+    rows = []
+    previous = []
+    for tr in _ROWS_XPATH(tbl):
+        row = []
+        for tc in _CELLS_XPATH(tr):
+            span = 1
+            merged = False
+            tcPr = tc.find(TCPR_TAG)
+            if tcPr is not None:
+                grid_span = tcPr.find(GRIDSPAN_TAG)
+                if grid_span is not None:
+                    span = int(grid_span.get(W_VAL, 1))
+                v_merge = tcPr.find(VMERGE_TAG)
+                merged = v_merge is not None and v_merge.get(W_VAL, "continue") == "continue"
             
-        if text.upper().startswith("SLIDE"):
-            if current_slide is not None:
-                slides_data.append(current_slide)
-            current_slide = {
-                "title": "",
-                "subtitle": "",
-                "content": [],
-                "tables": []
-            }
-            table_count = 0
-        elif current_slide is not None:
-            if text.startswith("Titre :"):
-                current_slide["title"] = text[len("Titre :"):].strip()
-            elif text.startswith("Sous-titre / Message clé :"):
-                current_slide["subtitle"] = text[len("Sous-titre / Message clé :"):].strip()
+            if merged and len(previous) > len(row):
+                text = previous[len(row)]
             else:
-                style_info = {
-                    "text": text,
-                    "level": 0,
-                    "list_type": None,
-                    "runs": []
-                }
-                
-                # Détection des listes
-                if para._element.pPr is not None:
-                    if para._element.pPr.numPr is not None:
-                        numPr = para._element.pPr.numPr
-                        ilvl = numPr.ilvl
-                        if ilvl is not None:
-                            style_info["level"] = ilvl.val
-                        numId = numPr.numId
-                        if numId is not None:
-                            if numId.val in [1, 2]:  # Puces
-                                style_info["list_type"] = "bullet"
-                            else:  # Numérotation
-                                style_info["list_type"] = "number"
-                
-                # Capture du formatage
-                for run in para.runs:
-                    run_info = {
-                        "text": run.text,
-                        "bold": bool(run.bold),
-                        "italic": bool(run.italic),
-                        "underline": bool(run.underline)
-                    }
-                    style_info["runs"].append(run_info)
-                
-                current_slide["content"].append(style_info)
+                text = "\n".join(_paragraph_text(p) for p in tc.iterchildren(P_TAG))
+            row.extend([text] * span)
+        if row:
+            rows.append(row)
+            previous = row
+    return rows
+
+def parse_word_document(doc_path):
+    """Parse le document Word et produit les données de chaque slide, une à une.
     
-    # Traitement des tableaux
-    for table in doc.tables:
-        if current_slide is not None:
-            current_slide["tables"].append(table)
+    La partie principale du document (en général word/document.xml) est lue
+    en flux : chaque paragraphe ou tableau de premier niveau est traité dès sa
+    fin de lecture puis libéré, et chaque slide est rendue dès le marqueur
+    "SLIDE" suivant, si bien que la mémoire utilisée ne dépend pas de la
+    taille du document.
+    """
+    current_slide = None
+
+    with zipfile.ZipFile(doc_path) as docx_zip:
+        document_part = _rel_target(docx_zip, "", RT_OFFICE_DOCUMENT) or "word/document.xml"
+        list_types = _numbering_list_types(docx_zip, document_part)
+        with docx_zip.open(document_part) as xml_file:
+            for _, element in etree.iterparse(xml_file, events=("end",), tag=(P_TAG, TBL_TAG)):
+                # Paragraphes de tableaux ou de zones de texte : lus avec leur parent
+                if element.getparent().tag != BODY_TAG:
+                    continue
+
+                if element.tag == TBL_TAG:
+                    if current_slide is not None:
+                        rows = _table_rows(element)
+                        if rows:
+                            current_slide["tables"].append(rows)
+                else:
+                    text = _paragraph_text(element).strip()
+
+                    marker = _MARKER_RE.match(text)
+                    if marker is not None and marker.lastindex == _SLIDE:
+                        if current_slide is not None:
+                            yield current_slide
+                        current_slide = {
+                            "title": "",
+                            "subtitle": "",
+                            "content": [],
+                            "tables": []
+                        }
+                    elif text and current_slide is not None:
+                        if marker is not None:
+                            value = marker.group(marker.lastindex)
+                            if marker.lastindex == _TITLE:
+                                current_slide["title"] = value
+                            else:
+                                current_slide["subtitle"] = value
+                        else:
+                            style_info = {
+                                "text": text,
+                                "level": 0,
+                                "list_type": None,
+                                "runs": []
+                            }
+
+                            # Détection des listes (une seule évaluation XPath : "ilvl|numId")
+                            ilvl, _, num_id = _NUMPR_XPATH(element).partition("|")
+                            if ilvl:
+                                style_info["level"] = min(int(ilvl), MAX_LIST_LEVELS - 1)
+                            if num_id:
+                                list_type = list_types.get((num_id, ilvl or "0"))
+                                if list_type is None:
+                                    # Numérotation non définie : puces pour les identifiants 1 et 2
+                                    list_type = "bullet" if int(num_id) in (1, 2) else "number"
+                                style_info["list_type"] = list_type
+
+                            # Capture du formatage (mise en forme directe des runs)
+                            for r in element.iterchildren(R_TAG):
+                                run_info = {
+                                    "text": _run_text(r),
+                                    "format": _run_flags(r.find(RPR_TAG))
+                                }
+                                style_info["runs"].append(run_info)
+
+                            current_slide["content"].append(style_info)
+
+                # Libération de l'élément traité et des éléments déjà lus
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
     
-    # Ajout de la dernière slide
+    # Dernière slide
     if current_slide is not None:
-        slides_data.append(current_slide)
+        yield current_slide
+
+def _cached_slides(cache_path):
+    """Slides d'une entrée du cache, relues une à une jusqu'au marqueur de fin.
+
+    Une entrée absente, tronquée ou mal formée lève une exception.
+    """
+    with open(cache_path, "rb") as cache_file:
+        while True:
+            slide_data = pickle.load(cache_file)
+            if slide_data is None:
+                return
+            if not (isinstance(slide_data, dict) and slide_data.keys() == _SLIDE_KEYS):
+                raise pickle.UnpicklingError(f"Entrée de cache invalide : {cache_path}")
+            yield slide_data
+
+def cached_word_document(doc_path, cache_dir=CACHE_DIR):
+    """Produit les données des slides du document Word en passant par un cache disque.
+    
+    Le cache est indexé par le nom et le chemin absolu du fichier et par
+    l'empreinte SHA-256 de son contenu et de ce script : un document inchangé
+    n'est pas relu, un document ou un convertisseur modifié crée une nouvelle
+    entrée qui remplace les précédentes du même fichier. Les slides sont
+    enregistrées une à une au fil de la lecture et relues de même, si bien que
+    le cache ne garde jamais plus d'une slide en mémoire. Il reste facultatif :
+    une entrée illisible est ignorée et une erreur d'écriture n'interrompt pas
+    la conversion.
+    """
+    digest = hashlib.sha256()
+    for path in (__file__, doc_path):
+        with open(path, "rb") as source_file:
+            for block in iter(lambda: source_file.read(1 << 20), b""):
+                digest.update(block)
+    digest = digest.hexdigest()
+    prefix = "%s-%s-" % (
+        os.path.basename(doc_path),
+        hashlib.sha256(os.fsencode(os.path.abspath(doc_path))).hexdigest()[:16],
+    )
+    cache_path = os.path.join(cache_dir, f"{prefix}{digest}.pkl")
+    
+    # Une entrée invalide en cours de lecture reprend l'analyse du document
+    # après les slides déjà produites
+    loaded = 0
+    try:
+        for slide_data in _cached_slides(cache_path):
+            yield slide_data
+            loaded += 1
+        return
+    except Exception:
+        pass
+    
+    # Écriture au fil de la lecture dans un fichier temporaire, renommé une fois
+    # le marqueur de fin écrit : une conversion parallèle du même document ne
+    # lit jamais une entrée incomplète
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        cache_file = open(tmp_path, "wb")
+    except OSError as e:
+        print(f"Warning: Cache non enregistré ({e})")
+        cache_file = None
+    saved = False
+    try:
+        for index, slide_data in enumerate(parse_word_document(doc_path)):
+            if cache_file is not None:
+                try:
+                    pickle.dump(slide_data, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+                except OSError as e:
+                    print(f"Warning: Cache non enregistré ({e})")
+                    cache_file.close()
+                    cache_file = None
+            if index >= loaded:
+                yield slide_data
+        if cache_file is not None:
+            try:
+                pickle.dump(None, cache_file)
+                cache_file.close()
+                os.replace(tmp_path, cache_path)
+                saved = True
+            except OSError as e:
+                print(f"Warning: Cache non enregistré ({e})")
+    finally:
+        if cache_file is not None:
+            cache_file.close()
+        if not saved:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    if not saved:
+        return
+
+    # Suppression des entrées obsolètes du même document
+    stale_re = re.compile(re.escape(prefix) + r"[0-9a-f]{64}\.pkl")
+    try:
+        for name in os.listdir(cache_dir):
+            if stale_re.fullmatch(name) and name != os.path.basename(cache_path):
+                os.remove(os.path.join(cache_dir, name))
+    except OSError:
+        pass
+
+def _run_xml(text, bold=False, italic=False, underline=False, sz=1200, font="Arial"):
+    """Fragment XML d'un run <a:r> formaté (texte échappé, sz en centièmes de point).
     
-    return slides_data
+    Gras, italique et souligné ne sont écrits que s'ils sont actifs, leur
+    absence valant désactivation. Comme le texte d'un paragraphe python-pptx,
+    chaque "\n" ou "\v" devient un saut de ligne <a:br/> entre deux runs.
+    """
+    run = (
+        '<a:r><a:rPr sz="%d"%s%s%s><a:latin typeface="%s"/></a:rPr><a:t>%%s</a:t></a:r>'
+        % (
+            sz,
+            ' b="1"' if bold else "",
+            ' i="1"' if italic else "",
+            ' u="sng"' if underline else "",
+            font
+        )
+    )
+    return "<a:br/>".join(
+        run % escape(line) if line else ""
+        for line in _LINE_BREAK_RE.split(text)
+    )
 
-def add_formatted_text(paragraph, content, number_counters=None):
-    """Ajoute du texte formaté à un paragraphe."""
+def formatted_paragraph_xml(content, number_counters=None):
+    """Fragment XML <a:p> d'un paragraphe de contenu, puces et numérotation comprises."""
     if number_counters is None:
-        number_counters = {}
+        number_counters = [0] * MAX_LIST_LEVELS
+    
+    # Cas le plus courant (paragraphe hors liste d'un seul run) : fragment direct
+    runs = content.get("runs")
+    if not content.get("list_type") and runs and len(runs) == 1:
+        run = runs[0]
+        return "<a:p>%s</a:p>" % _run_xml(run["text"], *run["format"])
     
     level = content.get("level", 0)
     prefix = ""
+    parts = ["<a:p>"]
     
     # Application des listes
     if content.get("list_type"):
-        paragraph.level = level
-        indent = "    " * level
+        if level:
+            parts.append('<a:pPr lvl="%d"/>' % level)
+        indent = _INDENTS[level]
         
         if content["list_type"] == "bullet":
             prefix = f"{indent}• "
         else:
-            if level not in number_counters:
-                number_counters[level] = 0
             number_counters[level] += 1
             
             # Réinitialisation des niveaux supérieurs
-            for l in list(number_counters.keys()):
-                if l > level:
-                    number_counters[l] = 0
+            for l in range(level + 1, MAX_LIST_LEVELS):
+                number_counters[l] = 0
                     
             prefix = f"{indent}{number_counters[level]}. "
     
     # Ajout du texte avec formatage
-    if content.get("runs"):
-        first_run = True
-        for run_format in content["runs"]:
-            run = paragraph.add_run()
-            if first_run:
-                run.text = prefix + run_format["text"]
-                first_run = False
-            else:
-                run.text = run_format["text"]
-            
-            run.font.name = "Arial"
-            run.font.size = Pt(12)  # Taille de police par défaut augmentée à 12
-            run.font.bold = run_format.get("bold", False)
-            run.font.italic = run_format.get("italic", False)
-            run.font.underline = run_format.get("underline", False)
+    if runs:
+        # Runs adjacents de même formatage fusionnés en un seul <a:r>
+        for formatting, group in groupby(runs, itemgetter("format")):
+            parts.append(_run_xml(prefix + "".join(r["text"] for r in group), *formatting))
+            prefix = ""
     else:
-        paragraph.text = prefix + content["text"]
-        paragraph.font.name = "Arial"
-        paragraph.font.size = Pt(12)  # Taille de police par défaut augmentée à 12
-        
-    # Ajout de l'espacement après le paragraphe (3 points)
-    paragraph.space_after = Pt(3)
+        parts.append(_run_xml(prefix + content["text"]))
+    
+    parts.append("</a:p>")
+    return "".join(parts)
+
+def _cell_xml(text, bold, sz=1000):
+    """Fragment XML <a:tc> d'une cellule de tableau (un paragraphe par ligne)."""
+    paragraphs = []
+    for line in text.split("\n"):
+        if line:
+            paragraphs.append("<a:p>%s</a:p>" % _run_xml(line, bold, sz=sz))
+        else:
+            # Ligne vide : la taille reste portée par la fin de paragraphe
+            paragraphs.append('<a:p><a:endParaRPr sz="%d"/></a:p>' % sz)
+    return _CELL_XML % "".join(paragraphs)
 
-def create_slide(prs, slide_data):
+def create_slide(prs, slide_data, layout):
     """Crée une slide complète avec son contenu."""
-    # Sélection du layout
-    layout = next((l for l in prs.slide_layouts if l.name == 'Blank'), 
-                 prs.slide_layouts[0])
     slide = prs.slides.add_slide(layout)
+    shapes = slide.shapes
     
-    # Ajout du titre
-    title_box = slide.shapes.add_textbox(
-        TITLE_ZONE["x"], TITLE_ZONE["y"],
-        TITLE_ZONE["width"], TITLE_ZONE["height"]
-    )
-    title_frame = title_box.text_frame
-    title_frame.word_wrap = True
-    title_frame.paragraphs[0].text = slide_data["title"]
-    title_frame.paragraphs[0].font.name = "Arial"
-    title_frame.paragraphs[0].font.size = Pt(22)
-    title_frame.paragraphs[0].font.bold = True
-    
-    # Ajout du sous-titre
-    subtitle_box = slide.shapes.add_textbox(
-        SUBTITLE_ZONE["x"], SUBTITLE_ZONE["y"],
-        SUBTITLE_ZONE["width"], SUBTITLE_ZONE["height"]
-    )
-    subtitle_frame = subtitle_box.text_frame
-    subtitle_frame.word_wrap = True
-    subtitle_frame.paragraphs[0].text = slide_data["subtitle"]
-    subtitle_frame.paragraphs[0].font.name = "Arial"
-    subtitle_frame.paragraphs[0].font.size = Pt(18)
+    # Zones de texte assemblées en XML puis ajoutées à la slide en une fois
+    # (aucune zone vide n'est créée)
+    bodies = []
+    if slide_data["title"]:
+        bodies.append((_TITLE_SP_XML, "<a:lstStyle/><a:p>%s</a:p>" % _run_xml(
+            slide_data["title"], True, sz=2200
+        )))
+    if slide_data["subtitle"]:
+        bodies.append((_SUBTITLE_SP_XML, "<a:lstStyle/><a:p>%s</a:p>" % _run_xml(
+            slide_data["subtitle"], sz=1800
+        )))
     
     # Zone de contenu unique
     if slide_data["content"]:
-        content_box = slide.shapes.add_textbox(
-            CONTENT_ZONE["x"], CONTENT_ZONE["y"],
-            CONTENT_ZONE["width"], CONTENT_ZONE["height"]
-        )
-        content_frame = content_box.text_frame
-        content_frame.word_wrap = True
-        
-        number_counters = {}
-        first_paragraph = True
-        
-        for content in slide_data["content"]:
-            if first_paragraph:
-                paragraph = content_frame.paragraphs[0]
-                first_paragraph = False
-            else:
-                paragraph = content_frame.add_paragraph()
-            
-            add_formatted_text(paragraph, content, number_counters)
-        
-        # Position pour les tableaux
-        current_y = CONTENT_ZONE["y"] + content_box.height + Inches(0.2)
-    else:
-        current_y = CONTENT_ZONE["y"]
+        number_counters = [0] * MAX_LIST_LEVELS
+        bodies.append((_CONTENT_SP_XML, _CONTENT_LST_STYLE + "".join(
+            formatted_paragraph_xml(content, number_counters)
+            for content in slide_data["content"]
+        )))
     
-    # Ajout des tableaux
-    for table in slide_data["tables"]:
-        if current_y + Inches(1) > (CONTENT_ZONE["y"] + CONTENT_ZONE["height"]):
-            print(f"Warning: Espace insuffisant pour un tableau")
+    if bodies:
+        shape_id = shapes._next_shape_id
+        sp_tree = shapes._spTree
+        shapes_xml = parse_xml(_SHAPES_XML % "".join(
+            sp_xml % (shape_id + i, shape_id + i - 1, body)
+            for i, (sp_xml, body) in enumerate(bodies)
+        ))
+        for sp in list(shapes_xml):
+            sp_tree.insert_element_before(sp, "p:extLst")
+    
+    # Les tableaux prennent la place de la zone de contenu : sur une slide avec
+    # du contenu texte, qui occupe toute cette zone, ils sont ignorés
+    tables = slide_data["tables"]
+    if tables and slide_data["content"]:
+        print(f"Warning: {len(tables)} tableau(x) ignoré(s), la zone de contenu est occupée par le texte")
+        tables = []
+    current_y = CONTENT_ZONE["y"]
+    
+    # Ajout des tableaux (listes de lignes de textes extraites du Word)
+    for index, rows in enumerate(tables):
+        if current_y + INCH_1 > CONTENT_BOTTOM:
+            print(f"Warning: Espace insuffisant, {len(tables) - index} tableau(x) ignoré(s)")
             break
         
+        table_height = TABLE_ROW_HEIGHT * len(rows)
+        n_cols = max(len(row) for row in rows)
         slide_table = slide.shapes.add_table(
-            len(table.rows), len(table.columns),
+            len(rows), n_cols,
             CONTENT_ZONE["x"], current_y,
-            CONTENT_ZONE["width"], Inches(len(table.rows) * 0.3)
+            CONTENT_ZONE["width"], table_height
         ).table
         
-        # Copie du contenu
-        for i, row in enumerate(table.rows):
-            for j, cell in enumerate(row.cells):
-                target_cell = slide_table.cell(i, j)
-                target_cell.text = cell.text
-                
-                # Formatage
-                for paragraph in target_cell.text_frame.paragraphs:
-                    paragraph.font.name = "Arial"
-                    paragraph.font.size = Pt(10)
-                    if i == 0:  # En-tête
-                        paragraph.font.bold = True
+        # Lignes assemblées en XML (en-tête en gras, cellules manquantes
+        # laissées vides) puis substituées en une fois à celles d'add_table
+        tbl = slide_table._tbl
+        new_rows = parse_xml(_TABLE_XML % "".join(
+            '<a:tr h="%s">%s%s</a:tr>' % (
+                tr.get("h"),
+                "".join(_cell_xml(text, i == 0) for text in row),
+                _EMPTY_CELL_XML * (n_cols - len(row))
+            )
+            for i, (tr, row) in enumerate(zip(tbl.tr_lst, rows))
+        ))
+        for old_tr, new_tr in zip(tbl.tr_lst, list(new_rows)):
+            tbl.replace(old_tr, new_tr)
         
-        current_y += Inches(len(table.rows) * 0.3) + Inches(0.2)
+        current_y += table_height + INCH_0_2
     
     return slide
 
-def main(input_docx, template_pptx, output_pptx):
+def main(input_docx, template_pptx, output_pptx, use_cache=True):
     """Fonction principale de conversion."""
     print("\nValidation des fichiers...")
     if not os.path.exists(input_docx):
@@ -283,35 +674,102 @@ def main(input_docx, template_pptx, output_pptx):
     for i, layout in enumerate(prs.slide_layouts):
         print(f" - Layout {i}: {layout.name}")
     
-    print("\nExtraction du contenu Word...")
-    slides_data = parse_word_document(input_docx)
-    
     print("\nCréation de la présentation PowerPoint...")
-    # Suppression des slides existantes
+    # Suppression des slides existantes : liste vidée en un appel, puis
+    # abandon des relations pour que les anciennes parts ne soient pas réécrites
     xml_slides = prs.slides._sldIdLst
-    for sld in list(xml_slides):
-        xml_slides.remove(sld)
+    rIds = [sld.get(qn("r:id")) for sld in xml_slides]
+    xml_slides.clear()
+    for rId in rIds:
+        prs.part.drop_rel(rId)
     
-    # Création des nouvelles slides
-    for i, slide_data in enumerate(slides_data, 1):
-        print(f"Création de la slide {i}/{len(slides_data)}")
-        create_slide(prs, slide_data)
+    # Sélection du layout, une seule fois pour toutes les slides
+    layout = next((l for l in prs.slide_layouts if l.name == 'Blank'), 
+                 prs.slide_layouts[0])
+    
+    # Création des nouvelles slides au fil de la lecture du Word
+    print("\nExtraction du contenu Word et création des slides...")
+    slides = cached_word_document(input_docx) if use_cache else parse_word_document(input_docx)
+    slide_count = 0
+    for slide_count, slide_data in enumerate(slides, 1):
+        if slide_count % PROGRESS_INTERVAL == 0:
+            print(f"Création de la slide {slide_count}")
+        create_slide(prs, slide_data, layout)
+    print(f"{slide_count} slide(s) créée(s)")
     
     print("\nSauvegarde de la présentation...")
-    prs.save(output_pptx)
+    # Archive construite en mémoire puis écrite sur disque en une seule fois
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    with open(output_pptx, "wb") as output_file:
+        output_file.write(buffer.getbuffer())
     print(f"Conversion terminée ! Fichier sauvegardé : {output_pptx}")
 
+def _convert_job(input_docx, template_pptx, output_pptx, use_cache):
+    """Conversion exécutée dans un processus du pool, sortie préfixée par son fichier Word.
+
+    Les messages de main sont capturés puis affichés d'un bloc à la fin de la
+    conversion, chaque ligne étant étiquetée par le document converti, pour
+    que les sorties des conversions parallèles restent lisibles.
+    """
+    output = io.StringIO()
+    try:
+        with redirect_stdout(output):
+            main(input_docx, template_pptx, output_pptx, use_cache)
+    finally:
+        label = f"[{input_docx}] "
+        lines = output.getvalue().splitlines()
+        print("".join(label + line + "\n" for line in lines if line), end="", flush=True)
+
+def convert_many(jobs, template_pptx, max_workers=None, use_cache=True):
+    """Convertit plusieurs documents Word, en parallèle dans un pool de processus.
+    
+    jobs est une liste de couples (input_docx, output_pptx) : chaque conversion
+    lit et écrit ses propres fichiers, sans état partagé. Une conversion unique
+    est faite directement dans le processus courant. Toutes les conversions
+    sont menées à terme, puis les échecs éventuels sont signalés ensemble avec
+    le document concerné.
+    """
+    outputs = [os.path.normcase(os.path.abspath(output_pptx)) for _, output_pptx in jobs]
+    duplicates = sorted({output for output in outputs if outputs.count(output) > 1})
+    if duplicates:
+        raise ValueError(f"Fichier(s) de sortie en double : {', '.join(duplicates)}")
+
+    if len(jobs) == 1:
+        input_docx, output_pptx = jobs[0]
+        main(input_docx, template_pptx, output_pptx, use_cache)
+        return
+    
+    failures = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_convert_job, input_docx, template_pptx, output_pptx, use_cache): input_docx
+            for input_docx, output_pptx in jobs
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failures.append(f"{futures[future]} : {e}")
+
+    if failures:
+        raise RuntimeError(
+            f"{len(failures)} conversion(s) sur {len(jobs)} en échec :\n  " + "\n  ".join(failures)
+        )
+
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python convert.py input.docx output.pptx")
+    args = sys.argv[1:]
+    use_cache = "--no_cache" not in args
+    args = [arg for arg in args if arg != "--no_cache"]
+    if len(args) < 2 or len(args) % 2:
+        print("Usage: python convert.py [--no_cache] input.docx output.pptx [input2.docx output2.pptx ...]")
         sys.exit(1)
     
     try:
-        input_docx = sys.argv[1]
-        output_pptx = sys.argv[2]
+        jobs = list(zip(args[0::2], args[1::2]))
         template_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "template_CVA.pptx")
         
-        main(input_docx, template_file, output_pptx)
+        convert_many(jobs, template_file, use_cache=use_cache)
     except Exception as e:
         print(f"Erreur lors de la conversion : {str(e)}")
         sys.exit(1)